@@ -1,15 +1,296 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import heapq
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import networkx as nx
+import numpy as np
+from array import array
+import functools
+import math
 import json
 import os
+import sys
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional, dijkstra falls back to _dijkstra_py
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+class IndexedHeap:
+    """Binary min-heap of node indices supporting decrease_key"""
+
+    def __init__(self, n, inf=float('inf')):
+        self.heap = []
+        self.pos = [-1] * n  # Index of each node in heap, -1 if absent
+        self.key = [inf] * n
+
+    def __len__(self):
+        return len(self.heap)
+
+    def decrease_key(self, v, new_key):
+        """Insert v with new_key, or lower its key if already queued"""
+        self.key[v] = new_key
+        i = self.pos[v]
+        if i == -1:
+            i = len(self.heap)
+            self.heap.append(v)
+        self._sift_up(i, v)
+
+    def pop_min(self):
+        """Remove and return the node with the smallest key"""
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            self._sift_down(0, last)
+        return top
+
+    def _sift_up(self, i, v):
+        heap, pos, key = self.heap, self.pos, self.key
+        k = key[v]
+        while i > 0:
+            p = (i - 1) // 2
+            w = heap[p]
+            if key[w] <= k:
+                break
+            heap[i] = w
+            pos[w] = i
+            i = p
+        heap[i] = v
+        pos[v] = i
+
+    def _sift_down(self, i, v):
+        heap, pos, key = self.heap, self.pos, self.key
+        k = key[v]
+        size = len(heap)
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            w = heap[child]
+            if key[w] >= k:
+                break
+            heap[i] = w
+            pos[w] = i
+            i = child
+        heap[i] = v
+        pos[v] = i
+
+
+class RadixHeap:
+    """Monotone radix heap for non-negative integer keys
+
+    Entries are bucketed by the highest bit in which their key differs from
+    the last popped key, which gives O(1) amortized pop_min as long as keys
+    are never smaller than the last one popped, as in Dijkstra.
+    """
+
+    def __init__(self):
+        self.buckets = [[] for _ in range(65)]  # One per bit width of a 64-bit key
+        self.last = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, key, v):
+        """Queue v with key, which must be >= the last popped key"""
+        self.buckets[(key ^ self.last).bit_length()].append((key, v))
+        self.size += 1
+
+    def pop_min(self):
+        """Remove and return the (key, node) pair with the smallest key"""
+        buckets = self.buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+
+            # Redistribute the lowest non-empty bucket around its minimum;
+            # every entry lands in a strictly lower bucket
+            bucket = buckets[i]
+            self.last = last = min(bucket)[0]
+            for entry in bucket:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+            bucket.clear()
+
+        self.size -= 1
+        return buckets[0].pop()
+
+
+@njit(cache=True)
+def _dijkstra_csr(indptr, indices, weights, start, end, n, inf):
+    """Dijkstra kernel over CSR arrays, returns (dist, parent) arrays
+
+    dist takes the type of inf, so integer weights stay in int64.
+    """
+    dist = np.full(n, inf)
+    parent = np.full(n, -1, dtype=np.int32)
+
+    # Indexed binary min-heap inlined as arrays, keyed by dist. Each node is
+    # queued at most once, so a popped node is final and no visited set is
+    # needed.
+    heap = np.empty(n, dtype=np.int32)
+    pos = np.full(n, -1, dtype=np.int32)
+    heap[0] = start
+    pos[start] = 0
+    size = 1
+    dist[start] = 0
+
+    while size > 0:
+        u = heap[0]
+        pos[u] = -1
+
+        if u == end:
+            break
+
+        # Move the last entry to the root and sift it down
+        size -= 1
+        if size > 0:
+            last = heap[size]
+            key = dist[last]
+            i = 0
+            while True:
+                child = 2 * i + 1
+                if child >= size:
+                    break
+                if child + 1 < size and dist[heap[child + 1]] < dist[heap[child]]:
+                    child += 1
+                w = heap[child]
+                if dist[w] >= key:
+                    break
+                heap[i] = w
+                pos[w] = i
+                i = child
+            heap[i] = last
+            pos[last] = i
+
+        curr_dist = dist[u]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            new_dist = curr_dist + weights[k]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                parent[v] = u
+
+                # Decrease key: append if absent, then sift up
+                i = pos[v]
+                if i == -1:
+                    i = size
+                    size += 1
+                while i > 0:
+                    p = (i - 1) // 2
+                    w = heap[p]
+                    if dist[w] <= new_dist:
+                        break
+                    heap[i] = w
+                    pos[w] = i
+                    i = p
+                heap[i] = v
+                pos[v] = i
+
+    return dist, parent
+
+
+@njit(cache=True)
+def _reconstruct_csr(parent, end, n):
+    """Index path from the root of a parent array to end"""
+    path_buf = np.empty(n, dtype=np.int32)
+    k = 0
+    node = end
+    while node != -1:
+        path_buf[k] = node
+        k += 1
+        node = parent[node]
+    return path_buf[:k][::-1].copy()
+
+
+def _dijkstra_py(indptr, indices, weights, start, end, n, inf):
+    """Pure Python counterpart of _dijkstra_csr used when Numba is missing"""
+    heap = IndexedHeap(n, inf)
+    dist = heap.key
+    parent = [-1] * n
+    heap.decrease_key(start, 0)
+
+    while heap:
+        u = heap.pop_min()
+
+        if u == end:
+            break
+
+        curr_dist = dist[u]
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            new_dist = curr_dist + weights[k]
+            if new_dist < dist[v]:
+                parent[v] = u
+                heap.decrease_key(v, new_dist)
+
+    return np.array(dist), np.array(parent, dtype=np.int32)
+
+
+def _dijkstra_radix(indptr, indices, weights, start, end, n, inf):
+    """Pure Python Dijkstra for integer weights using a RadixHeap"""
+    heap = RadixHeap()
+    dist = [inf] * n
+    parent = [-1] * n
+    dist[start] = 0
+    heap.push(0, start)
+
+    while heap:
+        curr_dist, u = heap.pop_min()
+
+        # The radix heap has no decrease_key, skip superseded entries
+        if curr_dist > dist[u]:
+            continue
+
+        if u == end:
+            break
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            new_dist = curr_dist + weights[k]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                parent[v] = u
+                heap.push(new_dist, v)
+
+    return np.array(dist), np.array(parent, dtype=np.int32)
+
+
+def _display_number(value, magnitude):
+    """Round float64 noise below the precision of magnitude for display
+
+    Values derived from a dist array carry errors of about one ulp of the
+    largest distance involved. Whole numbers are shown as int.
+    """
+    if isinstance(value, float):
+        if magnitude > 0:
+            value = round(value, 15 - math.ceil(math.log10(magnitude)))
+        if value.is_integer():
+            return int(value)
+    return value
+
 
 class GraphRouteFinder:
     def __init__(self):
         self.graph = {}
+        self._graph_version = 0
+        self._layout_version = 0  # Only bumped when the node set changes
+        self._sssp_cache = {}  # (start, graph_version) -> (dist, parent)
+        self._csr_cache = None  # array.array copy of the CSR for pure Python kernels
+        self._last_start = None
+        self._fig = None
+        self._pos = None
+        self._pos_version = None
+        self._edge_labels_cache = (None, {})  # (graph_version, {(u, v): weight})
+        self.canvas = None
+        self._dijkstra_cached = functools.lru_cache(maxsize=256)(self._dijkstra_versioned)
         self.load_default_graph()
         self.create_gui()
 
@@ -24,79 +305,261 @@ class GraphRouteFinder:
             'F': {'D': 6, 'E': 2}
         }
         
+        # Prefer the binary snapshot, its CSR arrays need no rebuild
+        if os.path.exists("graph_data.npz"):
+            try:
+                self._load_npz("graph_data.npz")
+                self._graph_changed(nodes_changed=True, rebuild_csr=False)
+                return
+            except:
+                pass
+        
         # Check if there's a saved graph
+        migrate = False
         if os.path.exists("graph_data.json"):
             try:
                 with open("graph_data.json", "r") as f:
                     self.graph = json.load(f)
+                migrate = True
             except:
                 self.graph = default_graph
         else:
             self.graph = default_graph
+        self._graph_changed(nodes_changed=True)
+        
+        # One-time migration of a JSON save to the binary format. If the
+        # directory isn't writable, keep running from the JSON graph; the
+        # next Save retries the write.
+        if migrate:
+            try:
+                self.save_graph_v2()
+            except OSError:
+                pass
+
+    def _load_npz(self, filename):
+        """Load the CSR arrays saved by save_graph_v2 and derive self.graph"""
+        # npz archives can't be memory-mapped, np.load reads each array lazily
+        with np.load(filename, allow_pickle=False) as data:
+            nodes = data["nodes"].tolist()
+            indptr = data["indptr"]
+            indices = data["indices"]
+            weights = data["weights"]
+        
+        graph = {}
+        neighbor_names = [nodes[i] for i in indices.tolist()]
+        weight_values = weights.tolist()
+        if not np.issubdtype(weights.dtype, np.integer):
+            # Mixed graphs are stored as float64, restore the whole numbers
+            weight_values = [int(w) if w.is_integer() else w for w in weight_values]
+        for i, node in enumerate(nodes):
+            lo, hi = indptr[i], indptr[i + 1]
+            graph[node] = dict(zip(neighbor_names[lo:hi], weight_values[lo:hi]))
+        
+        self.graph = graph
+        self._set_csr(nodes, indptr, indices, weights)
+
+    def save_graph_v2(self):
+        """Save the graph as CSR arrays to a binary file that loads without parsing"""
+        # Built from self.graph, the data the editor changes, not the cached CSR
+        node_of, indptr, indices, weights = self._build_csr()
+        np.savez("graph_data.npz", indptr=indptr, indices=indices,
+                 weights=weights, nodes=np.array(node_of, dtype=str))
+
+    def _graph_changed(self, nodes_changed=False, rebuild_csr=True):
+        """Bump the graph version and refresh state derived from the graph"""
+        if rebuild_csr:
+            self._rebuild_csr()
+        self._graph_version += 1
+        if nodes_changed:
+            self._layout_version += 1
+        self._dijkstra_cached.cache_clear()
+        self._sssp_cache.clear()
+        self._csr_cache = None
 
-    def save_graph(self):
-        """Save current graph to file"""
-        with open("graph_data.json", "w") as f:
-            json.dump(self.graph, f)
+    def _rebuild_csr(self):
+        """Rebuild the compressed sparse row (CSR) arrays used by dijkstra"""
+        self._set_csr(*self._build_csr())
+
+    def _build_csr(self):
+        """CSR arrays for self.graph as (node_of, indptr, indices, weights)"""
+        node_of = list(self.graph.keys())
+        idx_of = {node: i for i, node in enumerate(node_of)}
+
+        indptr = np.zeros(len(node_of) + 1, dtype=np.int32)
+        indices = []
+        weights = []
+        for i, node in enumerate(node_of):
+            neighbors = self.graph[node]
+            indptr[i + 1] = indptr[i] + len(neighbors)
+            indices.extend(idx_of[neighbor] for neighbor in neighbors)
+            weights.extend(neighbors.values())
+
+        # Non-negative integer weights allow the radix heap and int32 storage,
+        # as long as no path sum (at most n edges) can reach the int64 inf
+        # sentinel. Anything else is stored as float64 like the original graph.
+        weight_dtype = np.float64
+        if all(isinstance(w, int) and w >= 0 for w in weights):
+            max_weight = max(weights, default=0)
+            if max_weight * len(node_of) < np.iinfo(np.int64).max:
+                fits_int32 = max_weight <= np.iinfo(np.int32).max
+                weight_dtype = np.int32 if fits_int32 else np.int64
+
+        return (node_of, indptr, np.array(indices, dtype=np.int32),
+                np.array(weights, dtype=weight_dtype))
+
+    def _set_csr(self, node_of, indptr, indices, weights):
+        """Install CSR arrays and the node mapping used by dijkstra"""
+        self._node_of = node_of
+        self._idx_of = {node: i for i, node in enumerate(node_of)}
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+
+        # Integer weights keep distances in int64
+        self._int_weights = np.issubdtype(weights.dtype, np.integer)
+        self._dist_inf = np.iinfo(np.int64).max if self._int_weights else np.inf
+
+    def _py_csr(self):
+        """CSR arrays as array.array, built once per graph version
+
+        Indexing NumPy arrays element by element from Python is slow, while
+        array.array indexing returns plain ints and floats cheaply.
+        """
+        if self._csr_cache is None:
+            self._csr_cache = (
+                array('i', self._indptr.tolist()),
+                array('i', self._indices.tolist()),
+                array('q' if self._int_weights else 'd', self._weights.tolist()),
+            )
+        return self._csr_cache
+
+    def _run_dijkstra(self, src, dst):
+        """Run the fastest available kernel from src, stopping at dst unless -1"""
+        if HAVE_NUMBA:
+            indptr, indices, weights = self._indptr, self._indices, self._weights
+            kernel = _dijkstra_csr
+        else:
+            indptr, indices, weights = self._py_csr()
+            kernel = _dijkstra_radix if self._int_weights else _dijkstra_py
+        return kernel(indptr, indices, weights, src, dst, len(self._node_of), self._dist_inf)
+
+    def _sssp(self, start):
+        """Shortest path tree from start as (dist, parent) arrays"""
+        return self._run_dijkstra(self._idx_of[start], -1)
+
+    def _reconstruct(self, dist, parent, end):
+        """Route to end from kernel output as (distance, path, path_dist)
+
+        path_dist holds the distance from the start to each node on the path.
+        """
+        dst = self._idx_of[end]
+        if dist[dst] == self._dist_inf:
+            return float('inf'), [], dist[:0]
+
+        idx = _reconstruct_csr(parent, dst, len(self._node_of))
+        node_of = self._node_of
+        return dist[dst].item(), [node_of[i] for i in idx], dist[idx]
+
+    def _bidir_dijkstra(self, start, end):
+        """Point-to-point Dijkstra searching from both ends at once
+
+        The graph is undirected, so the backward search from end uses the
+        same CSR arrays. mu is the best start-end distance seen through any
+        scanned edge, and it is final once the two frontier minimums sum to
+        at least mu.
+        """
+        src = self._idx_of[start]
+        dst = self._idx_of[end]
+        if src == dst:
+            return 0, [start], np.zeros(1, dtype=self._weights.dtype)
+
+        n = len(self._node_of)
+        inf = self._dist_inf
+        indptr, indices, weights = self._py_csr()
+
+        pq_f = IndexedHeap(n, inf)
+        pq_b = IndexedHeap(n, inf)
+        dist_f, dist_b = pq_f.key, pq_b.key
+        parent_f = [-1] * n
+        parent_b = [-1] * n
+        pq_f.decrease_key(src, 0)
+        pq_b.decrease_key(dst, 0)
+
+        mu = inf
+        meet = -1
+        forward = True
+        while pq_f and pq_b:
+            if dist_f[pq_f.heap[0]] + dist_b[pq_b.heap[0]] >= mu:
+                break
+
+            if forward:
+                pq, dist, parent, other = pq_f, dist_f, parent_f, dist_b
+            else:
+                pq, dist, parent, other = pq_b, dist_b, parent_b, dist_f
+            forward = not forward
+
+            u = pq.pop_min()
+            curr_dist = dist[u]
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                new_dist = curr_dist + weights[k]
+                if new_dist < dist[v]:
+                    parent[v] = u
+                    pq.decrease_key(v, new_dist)
+                if other[v] != inf and dist[v] + other[v] < mu:
+                    mu = dist[v] + other[v]
+                    meet = v
+
+        if meet == -1:
+            return float('inf'), [], np.empty(0)
+
+        node_of = self._node_of
+        head = _reconstruct_csr(np.array(parent_f, dtype=np.int32), meet, n)
+        tail = _reconstruct_csr(np.array(parent_b, dtype=np.int32), meet, n)[-2::-1]
+        path_dist = np.concatenate([np.array(dist_f)[head], mu - np.array(dist_b)[tail]])
+        return mu, [node_of[i] for i in head] + [node_of[i] for i in tail], path_dist
 
     def dijkstra(self, start, end):
         """Find shortest path using Dijkstra's algorithm"""
-        if start not in self.graph or end not in self.graph:
-            return float('inf'), []
-            
-        pq = [(0, start)]
-        dist = {node: float('inf') for node in self.graph}
-        dist[start] = 0
-        parent = {node: None for node in self.graph}
-        visited = set()
-
-        while pq:
-            curr_dist, node = heapq.heappop(pq)
-            
-            if node in visited:
-                continue
-                
-            visited.add(node)
-            
-            if node == end:
-                break
-                
-            for neighbor, weight in self.graph[node].items():
-                if neighbor not in visited:
-                    new_dist = curr_dist + weight
-                    if new_dist < dist[neighbor]:
-                        dist[neighbor] = new_dist
-                        parent[neighbor] = node
-                        heapq.heappush(pq, (new_dist, neighbor))
-
-        # Reconstruct path
-        path = []
-        step = end
-        while step is not None:
-            path.append(step)
-            step = parent[step]
-        path.reverse()
-        
-        if dist[end] == float('inf'):
-            return float('inf'), []
-        return dist[end], path
+        if start not in self._idx_of or end not in self._idx_of:
+            return float('inf'), [], np.empty(0)
+
+        # Without the JIT kernel, searching from both ends settles far fewer
+        # nodes than a single forward sweep
+        if not HAVE_NUMBA:
+            return self._bidir_dijkstra(start, end)
+
+        dist, parent = self._run_dijkstra(self._idx_of[start], self._idx_of[end])
+        return self._reconstruct(dist, parent, end)
+
+    def _dijkstra_versioned(self, start, end, version):
+        """Route from the cached shortest path tree of start, keyed by version
+
+        A one-off query is answered point to point. Once the same start is
+        queried again, its full shortest path tree is built and cached.
+        """
+        key = (start, version)
+        tree = self._sssp_cache.get(key)
+        if tree is None:
+            if start != self._last_start:
+                self._last_start = start
+                return self.dijkstra(start, end)
+            tree = self._sssp_cache[key] = self._sssp(start)
+        dist, parent = tree
+        return self._reconstruct(dist, parent, end)
 
     def add_edge(self, node1, node2, weight):
         """Add edge to the graph"""
-        if node1 not in self.graph:
-            self.graph[node1] = {}
-        if node2 not in self.graph:
-            self.graph[node2] = {}
-            
-        self.graph[node1][node2] = weight
-        self.graph[node2][node1] = weight  # Assuming undirected graph
+        num_nodes = len(self.graph)
+        self.graph.setdefault(node1, {})[node2] = weight
+        self.graph.setdefault(node2, {})[node1] = weight  # Assuming undirected graph
+        self._graph_changed(nodes_changed=len(self.graph) != num_nodes)
 
     def remove_edge(self, node1, node2):
         """Remove edge from the graph"""
-        if node1 in self.graph and node2 in self.graph[node1]:
-            del self.graph[node1][node2]
-        if node2 in self.graph and node1 in self.graph[node2]:
-            del self.graph[node2][node1]
+        self.graph.get(node1, {}).pop(node2, None)
+        self.graph.get(node2, {}).pop(node1, None)
+        self._graph_changed()
 
     def get_nodes(self):
         """Get all nodes in the graph"""
@@ -104,38 +567,115 @@ class GraphRouteFinder:
 
     def visualize_graph(self, path=None):
         """Visualize the graph with matplotlib"""
-        G = nx.Graph()
-        
-        # Add edges to networkx graph
-        for node, neighbors in self.graph.items():
-            for neighbor, weight in neighbors.items():
-                G.add_edge(node, neighbor, weight=weight)
-        
-        pos = nx.spring_layout(G)
-        
-        # Create figure
-        fig, ax = plt.subplots(figsize=(8, 6))
+        # Imported here so app startup doesn't pay for matplotlib/networkx
+        import matplotlib.pyplot as plt
+        from matplotlib.collections import LineCollection
+        
+        # Each undirected edge once with its weight, rebuilt only after edits
+        if self._edge_labels_cache[0] != self._graph_version:
+            edge_labels = {(node, neighbor): weight for node, neighbors in self.graph.items()
+                           for neighbor, weight in neighbors.items() if node < neighbor}
+            self._edge_labels_cache = (self._graph_version, edge_labels)
+        edge_labels = self._edge_labels_cache[1]
+        
+        # Isolated nodes are not drawn
+        nodes = {node for edge in edge_labels for node in edge}
+        
+        # Edge-only edits keep the layout, new nodes warm-start from it. A
+        # node left isolated earlier has no position and forces a relayout.
+        if self._pos_version != self._layout_version or not nodes <= self._pos.keys():
+            import networkx as nx
+            
+            G = nx.Graph()
+            G.add_edges_from(edge_labels)
+            self._pos = nx.spring_layout(G, pos=self._pos)
+            self._pos_version = self._layout_version
+        pos = self._pos
+        
+        # Positions indexed by CSR node id, for vectorised path segments
+        self._pos_arr = np.full((len(self._node_of), 2), np.nan)
+        for i, node in enumerate(self._node_of):
+            if node in pos:
+                self._pos_arr[i] = pos[node]
+        
+        # Create the figure and its artists once, redraws update them in place
+        if self._fig is None:
+            self._fig, self._ax = plt.subplots(figsize=(8, 6))
+            ax = self._ax
+            
+            self._edge_coll = LineCollection([], colors='gray', alpha=0.5, zorder=1)
+            ax.add_collection(self._edge_coll)
+            
+            # Path edges, filled in by _set_path
+            self._path_edge_coll = LineCollection([], colors='red', linewidths=3, zorder=1)
+            ax.add_collection(self._path_edge_coll)
+            
+            self._node_coll = ax.scatter([], [], s=700, c='lightblue', zorder=2)
+            self._node_texts = {}
+            self._edge_texts = {}
+            
+            ax.set_title("Graph Visualization")
+            ax.axis('off')
+        ax = self._ax
         
         # Draw all edges
-        nx.draw_networkx_edges(G, pos, edge_color='gray', alpha=0.5, ax=ax)
-        
-        # Draw path edges if provided
-        if path and len(path) > 1:
-            path_edges = [(path[i], path[i+1]) for i in range(len(path)-1)]
-            nx.draw_networkx_edges(G, pos, edgelist=path_edges, edge_color='red', width=3, ax=ax)
+        self._edge_coll.set_segments([(pos[u], pos[v]) for u, v in edge_labels])
         
         # Draw nodes
-        nx.draw_networkx_nodes(G, pos, node_color='lightblue', node_size=700, ax=ax)
-        nx.draw_networkx_labels(G, pos, font_size=16, font_weight='bold', ax=ax)
-        
-        # Draw edge labels
-        edge_labels = nx.get_edge_attributes(G, 'weight')
-        nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels, ax=ax)
-        
-        ax.set_title("Graph Visualization")
-        ax.axis('off')
-        
-        return fig
+        xy = np.array([pos[node] for node in nodes]).reshape(-1, 2)
+        self._node_coll.set_offsets(xy)
+        self._sync_texts(self._node_texts, {node: (*pos[node], node, 0) for node in nodes},
+                         fontsize=16, fontweight='bold', zorder=3)
+        
+        # Draw edge labels at the edge midpoints, rotated along the edge
+        labels = {}
+        for (u, v), weight in edge_labels.items():
+            (x1, y1), (x2, y2) = pos[u], pos[v]
+            angle = np.degrees(np.arctan2(y2 - y1, x2 - x1))
+            if angle > 90:
+                angle -= 180
+            elif angle < -90:
+                angle += 180
+            labels[u, v] = ((x1 + x2) / 2, (y1 + y2) / 2, str(weight), angle)
+        self._sync_texts(self._edge_texts, labels, fontsize=10, rotation_mode='anchor',
+                         transform_rotates_text=True, zorder=1,
+                         bbox=dict(boxstyle='round', ec='white', fc='white'))
+        
+        # Collections don't take part in autoscaling, so fit the nodes by hand
+        if len(xy):
+            lo, hi = xy.min(axis=0), xy.max(axis=0)
+            pad = np.maximum((hi - lo) * 0.1, 0.1)
+            ax.set_xlim(lo[0] - pad[0], hi[0] + pad[0])
+            ax.set_ylim(lo[1] - pad[1], hi[1] + pad[1])
+        
+        self._drawn_version = self._graph_version
+        self._set_path(path)
+        return self._fig
+
+    def _sync_texts(self, texts, labels, **kwargs):
+        """Update Text artists in place from {key: (x, y, text, angle)}"""
+        for key in texts.keys() - labels.keys():
+            texts.pop(key).remove()
+        
+        for key, (x, y, text, angle) in labels.items():
+            artist = texts.get(key)
+            if artist is None:
+                texts[key] = self._ax.text(x, y, text, rotation=angle, ha='center',
+                                           va='center', **kwargs)
+            else:
+                artist.set_position((x, y))
+                artist.set_text(text)
+                artist.set_rotation(angle)
+
+    def _set_path(self, path):
+        """Highlight path on the current figure without redrawing the graph"""
+        path = path or []
+        idx = np.fromiter((self._idx_of[node] for node in path), dtype=np.intp, count=len(path))
+        segments = np.stack([self._pos_arr[idx[:-1]], self._pos_arr[idx[1:]]], axis=1)
+        self._path_edge_coll.set_segments(segments)
+        
+        if self.canvas is not None:
+            self.canvas.draw_idle()
 
     def create_gui(self):
         """Create the main GUI"""
@@ -200,7 +740,7 @@ class GraphRouteFinder:
         refresh_btn = ttk.Button(editor_frame, text="Refresh Nodes", command=self.refresh_node_menus)
         refresh_btn.grid(row=0, column=8, padx=(0, 10))
         
-        save_btn = ttk.Button(editor_frame, text="Save Graph", command=self.save_graph)
+        save_btn = ttk.Button(editor_frame, text="Save Graph", command=self.save_graph_v2)
         save_btn.grid(row=0, column=9)
         
         # Results section
@@ -222,11 +762,10 @@ class GraphRouteFinder:
         viz_frame.columnconfigure(0, weight=1)
         viz_frame.rowconfigure(0, weight=1)
         
-        # Matplotlib figure
-        self.fig = self.visualize_graph()
-        self.canvas = FigureCanvasTkAgg(self.fig, master=viz_frame)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # Matplotlib figure is built on first use, see _create_canvas
+        self.viz_frame = viz_frame
+        self.viz_placeholder = ttk.Label(viz_frame, text="Click Visualize to render")
+        self.viz_placeholder.grid(row=0, column=0)
         
         # Visualize button
         viz_btn = ttk.Button(main_frame, text="Visualize Current Graph", command=self.update_visualization)
@@ -251,32 +790,36 @@ class GraphRouteFinder:
             messagebox.showerror("Node Error", "Selected nodes do not exist in the graph")
             return
         
-        distance, path = self.dijkstra(start, end)
+        distance, path, path_dist = self._dijkstra_cached(start, end, self._graph_version)
         
         if distance == float('inf'):
             result_msg = f"No path found from {start} to {end}"
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, result_msg)
-            self.status_var.set("No path found")
-            self.update_visualization([])  # Update visualization with no path
+            status = "No path found"
         else:
-            result_msg = f"Shortest path from {start} to {end}:\n"
-            result_msg += f"Path: {' -> '.join(path)}\n"
-            result_msg += f"Distance: {distance} units\n\n"
-            
-            # Detailed breakdown
-            result_msg += "Path Details:\n"
-            total = 0
-            for i in range(len(path)-1):
-                node1, node2 = path[i], path[i+1]
-                weight = self.graph[node1][node2]
-                total += weight
-                result_msg += f"{node1} -> {node2}: {weight} units (Total: {total})\n"
+            # Detailed breakdown, edge weights are the steps in path_dist
+            magnitude = path_dist[-1].item()
+            distance = _display_number(distance, magnitude)
+            weights = [_display_number(w, magnitude) for w in np.diff(path_dist).tolist()]
+            totals = [_display_number(t, magnitude) for t in path_dist[1:].tolist()]
             
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, result_msg)
-            self.status_var.set(f"Found path with distance {distance}")
-            self.update_visualization(path)  # Update visualization with path
+            parts = [
+                f"Shortest path from {start} to {end}:",
+                f"Path: {' -> '.join(path)}",
+                f"Distance: {distance} units",
+                "",
+                "Path Details:",
+            ]
+            for node1, node2, weight, total in zip(path, path[1:], weights, totals):
+                parts.append(f"{node1} -> {node2}: {weight} units (Total: {total})")
+            result_msg = "\n".join(parts)
+            status = f"Found path with distance {distance}"
+        
+        # Apply all widget updates together so Tk redraws only once
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, result_msg)
+        self.status_var.set(status)
+        self.update_visualization(path)  # Update visualization with path, if any
+        self.root.update_idletasks()
 
     def add_edge_handler(self):
         """Handle add edge button click"""
@@ -288,8 +831,12 @@ class GraphRouteFinder:
             messagebox.showwarning("Input Error", "Please enter both node names")
             return
             
+        # Keep whole numbers as int so the graph stays on the integer fast path
         try:
-            weight = float(weight_str)
+            try:
+                weight = int(weight_str)
+            except ValueError:
+                weight = float(weight_str)
         except ValueError:
             messagebox.showerror("Input Error", "Weight must be a number")
             return
@@ -298,6 +845,11 @@ class GraphRouteFinder:
             messagebox.showerror("Input Error", "Weight must be positive")
             return
             
+        # Larger weights can't be stored as float64 in the CSR arrays
+        if weight > sys.float_info.max:
+            messagebox.showerror("Input Error", "Weight is too large")
+            return
+            
         self.add_edge(node1, node2, weight)
         self.refresh_node_menus()
         self.status_var.set(f"Added edge {node1}-{node2} with weight {weight}")
@@ -331,17 +883,27 @@ class GraphRouteFinder:
         self.start_menu['values'] = nodes
         self.end_menu['values'] = nodes
 
-    def update_visualization(self, path=None):
-        """Update the graph visualization"""
-        # Clear the previous canvas
-        self.canvas.get_tk_widget().destroy()
+    def _create_canvas(self, path=None):
+        """Replace the placeholder with the matplotlib canvas"""
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
         
-        # Create new figure
         self.fig = self.visualize_graph(path)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.canvas.get_tk_widget().master)
+        self.viz_placeholder.destroy()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
         self.canvas.draw()
         self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
 
+    def update_visualization(self, path=None):
+        """Update the graph visualization"""
+        # Only redraw the whole graph after it was edited, otherwise just
+        # move the highlighted path on the existing canvas
+        if self.canvas is None:
+            self._create_canvas(path)
+        elif self._drawn_version != self._graph_version:
+            self.visualize_graph(path)
+        else:
+            self._set_path(path)
+
     def run(self):
         """Run the application"""
         self.root.mainloop()